@@ -16,16 +16,6 @@ Example:
     app.run()
 """
 
-# Re-export all public symbols from the native extension
-from archimedes._archimedes import (
-    App,
-    Config,
-    Response,
-    RequestContext,
-    Identity,
-    ArchimedesError,
-)
-
 __all__ = [
     "App",
     "Config",
@@ -36,3 +26,20 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+# Public symbols are re-exported lazily from the native extension (PEP 562),
+# so `import archimedes` does not pay the extension load cost until a symbol
+# is first accessed.
+def __getattr__(name):
+    if name in __all__:
+        from archimedes import _archimedes
+
+        value = getattr(_archimedes, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -124,6 +124,14 @@ class Response:
         """Create an OK response (200)."""
         ...
     
+    @staticmethod
+    def ok_raw(
+        body: bytes,
+        headers: Optional[dict[str, str]] = None,
+    ) -> "Response":
+        """Create an OK response (200) from pre-encoded JSON bytes, sent without copying."""
+        ...
+    
     @staticmethod
     def created(
         body: Any = None,
@@ -197,6 +205,11 @@ class Config:
         """Load configuration from a YAML or JSON file."""
         ...
     
+    @staticmethod
+    def from_file_cached(path: str) -> "Config":
+        """Load configuration from a file, reusing a cached parse keyed on mtime and size."""
+        ...
+    
     @staticmethod
     def from_env() -> "Config":
         """Load configuration from environment variables."""
@@ -225,6 +238,10 @@ class App:
         """Register a handler function directly."""
         ...
     
+    def register_many(self, handlers: list[tuple[str, HandlerFunc]]) -> None:
+        """Register several (operation_id, handler) pairs in one call."""
+        ...
+    
     def run(self) -> None:
         """Run the application (blocking)."""
         ...
@@ -1,7 +1,9 @@
 //! Python configuration types for Archimedes
 
 use pyo3::prelude::*;
-use std::path::PathBuf;
+use serde::{Deserialize, Serialize};
+use std::path::{Path, PathBuf};
+use std::time::UNIX_EPOCH;
 
 /// Configuration for an Archimedes application
 ///
@@ -21,7 +23,7 @@ use std::path::PathBuf;
 /// )
 /// ```
 #[pyclass(name = "Config")]
-#[derive(Clone, Debug)]
+#[derive(Clone, Debug, Serialize, Deserialize)]
 pub struct PyConfig {
     /// Path to the contract file (JSON)
     #[pyo3(get, set)]
@@ -164,6 +166,29 @@ impl PyConfig {
         }
     }
 
+    /// Create configuration from a YAML or JSON file, reusing a cached parse
+    ///
+    /// The parsed configuration is stored under the user cache directory
+    /// (`$XDG_CACHE_HOME/archimedes` or `~/.cache/archimedes`), keyed on the
+    /// file's path, modification time and size and the archimedes version.
+    /// Any change to the file, or an unreadable cache entry, falls back to
+    /// `from_file` and replaces the entry.
+    ///
+    /// Args:
+    ///     path: Path to the configuration file
+    ///
+    /// Example:
+    ///     ```python
+    ///     config = Config.from_file_cached("config.yaml")
+    ///     ```
+    #[staticmethod]
+    fn from_file_cached(path: String) -> PyResult<Self> {
+        match config_cache_dir() {
+            Some(cache_dir) => Self::from_file_cached_in(path, &cache_dir),
+            None => Self::from_file(path),
+        }
+    }
+
     /// Create configuration from environment variables
     ///
     /// Environment variables:
@@ -346,6 +371,106 @@ impl PyConfig {
                 .unwrap_or(30),
         })
     }
+
+    /// `from_file_cached` with an explicit cache directory
+    fn from_file_cached_in(path: String, cache_dir: &Path) -> PyResult<Self> {
+        let Some((prefix, cache_file)) = cache_file_for(cache_dir, Path::new(&path)) else {
+            return Self::from_file(path);
+        };
+
+        if let Some(config) = std::fs::read(&cache_file)
+            .ok()
+            .and_then(|bytes| serde_json::from_slice::<Self>(&bytes).ok())
+        {
+            return Ok(config);
+        }
+
+        let config = Self::from_file(path)?;
+
+        // Caching is best-effort: a read-only or missing cache dir is not an error
+        if std::fs::create_dir_all(cache_dir).is_ok() {
+            if let Ok(bytes) = serde_json::to_vec(&config) {
+                if write_atomic(&cache_file, &bytes).is_ok() {
+                    remove_stale_entries(cache_dir, &prefix, &cache_file);
+                }
+            }
+        }
+
+        Ok(config)
+    }
+}
+
+/// Directory holding cached config parses, if one can be determined
+fn config_cache_dir() -> Option<PathBuf> {
+    let base = std::env::var_os("XDG_CACHE_HOME")
+        .map(PathBuf::from)
+        .or_else(|| std::env::var_os("HOME").map(|home| PathBuf::from(home).join(".cache")))?;
+    Some(base.join("archimedes"))
+}
+
+/// FNV-1a 64-bit offset basis
+const FNV_OFFSET: u64 = 0xcbf2_9ce4_8422_2325;
+
+/// Fold bytes into a 64-bit FNV-1a hash
+///
+/// Unlike `DefaultHasher`, the output is the same across Rust toolchains,
+/// so cache keys survive a rebuild.
+fn fnv1a(hash: u64, bytes: &[u8]) -> u64 {
+    bytes.iter().fold(hash, |hash, &byte| {
+        (hash ^ u64::from(byte)).wrapping_mul(0x0100_0000_01b3)
+    })
+}
+
+/// Cache file for a config file inside `cache_dir`
+///
+/// Returns the file name prefix shared by every entry for this config file
+/// (`config-<path hash>-`) and the full path of the current entry, whose
+/// suffix hashes the archimedes version, mtime and size.
+fn cache_file_for(cache_dir: &Path, path: &Path) -> Option<(String, PathBuf)> {
+    let metadata = std::fs::metadata(path).ok()?;
+    let mtime = metadata.modified().ok()?.duration_since(UNIX_EPOCH).ok()?;
+    let canonical = std::fs::canonicalize(path).ok()?;
+
+    let path_hash = fnv1a(FNV_OFFSET, canonical.as_os_str().as_encoded_bytes());
+    let mut state_hash = fnv1a(FNV_OFFSET, env!("CARGO_PKG_VERSION").as_bytes());
+    state_hash = fnv1a(state_hash, &mtime.as_nanos().to_le_bytes());
+    state_hash = fnv1a(state_hash, &metadata.len().to_le_bytes());
+
+    let prefix = format!("config-{path_hash:016x}-");
+    let cache_file = cache_dir.join(format!("{prefix}{state_hash:016x}.json"));
+    Some((prefix, cache_file))
+}
+
+/// Write `bytes` to `path` through a temporary file and a rename
+///
+/// Concurrent writers (e.g. several reload workers) each use their own
+/// temporary file, so readers never see a partially written entry.
+fn write_atomic(path: &Path, bytes: &[u8]) -> std::io::Result<()> {
+    let mut tmp = path.as_os_str().to_owned();
+    tmp.push(format!(".{}.tmp", std::process::id()));
+    let tmp = PathBuf::from(tmp);
+
+    let result = std::fs::write(&tmp, bytes).and_then(|()| std::fs::rename(&tmp, path));
+    if result.is_err() {
+        let _ = std::fs::remove_file(&tmp);
+    }
+    result
+}
+
+/// Remove cache entries for the same config file other than `current`
+fn remove_stale_entries(cache_dir: &Path, prefix: &str, current: &Path) {
+    let Ok(entries) = std::fs::read_dir(cache_dir) else {
+        return;
+    };
+    for entry in entries.flatten() {
+        let name = entry.file_name();
+        let is_stale = name
+            .to_str()
+            .is_some_and(|name| name.starts_with(prefix) && name.ends_with(".json"));
+        if is_stale && entry.path() != current {
+            let _ = std::fs::remove_file(entry.path());
+        }
+    }
 }
 
 #[cfg(test)]
@@ -600,6 +725,87 @@ mod tests {
         assert_eq!(empty_path.contract_path(), None);
     }
 
+    #[test]
+    fn test_config_cache_roundtrip() {
+        let config = PyConfig::from_json_value(serde_json::json!({
+            "contract_path": "contract.json",
+            "listen_port": 8002,
+            "opa_bundle_url": "./bundle.tar.gz"
+        }))
+        .unwrap();
+
+        let bytes = serde_json::to_vec(&config).unwrap();
+        let cached: PyConfig = serde_json::from_slice(&bytes).unwrap();
+
+        assert_eq!(cached.contract_path, "contract.json");
+        assert_eq!(cached.listen_port, 8002);
+        assert_eq!(cached.opa_bundle_url.as_deref(), Some("./bundle.tar.gz"));
+    }
+
+    #[test]
+    fn test_config_cache_key_tracks_file_changes() {
+        let cache_dir = std::env::temp_dir();
+        let path = std::env::temp_dir().join(format!(
+            "archimedes-config-cache-{}.yaml",
+            std::process::id()
+        ));
+        std::fs::write(&path, "contract_path: a.json\n").unwrap();
+        let (prefix, first) = cache_file_for(&cache_dir, &path).unwrap();
+        assert_eq!(
+            cache_file_for(&cache_dir, &path).unwrap(),
+            (prefix.clone(), first.clone())
+        );
+
+        std::fs::write(&path, "contract_path: other.json\n").unwrap();
+        let (second_prefix, second) = cache_file_for(&cache_dir, &path).unwrap();
+        assert_eq!(second_prefix, prefix);
+        assert_ne!(first, second);
+
+        std::fs::remove_file(&path).unwrap();
+        assert!(cache_file_for(&cache_dir, &path).is_none());
+    }
+
+    #[test]
+    fn test_from_file_cached_hits_and_refreshes() {
+        let dir = std::env::temp_dir().join(format!(
+            "archimedes-config-cache-test-{}",
+            std::process::id()
+        ));
+        let cache_dir = dir.join("cache");
+        std::fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("archimedes.yaml");
+        let path_str = path.to_str().unwrap().to_string();
+        let cache_entries = || -> Vec<PathBuf> {
+            std::fs::read_dir(&cache_dir)
+                .unwrap()
+                .map(|entry| entry.unwrap().path())
+                .collect()
+        };
+
+        std::fs::write(&path, "contract_path: a.json\n").unwrap();
+        let config = PyConfig::from_file_cached_in(path_str.clone(), &cache_dir).unwrap();
+        assert_eq!(config.contract_path, "a.json");
+        let entries = cache_entries();
+        assert_eq!(entries.len(), 1);
+
+        // A hit is served from the cache entry, not the source file
+        let marked =
+            PyConfig::from_json_value(serde_json::json!({"contract_path": "cached.json"})).unwrap();
+        std::fs::write(&entries[0], serde_json::to_vec(&marked).unwrap()).unwrap();
+        let config = PyConfig::from_file_cached_in(path_str.clone(), &cache_dir).unwrap();
+        assert_eq!(config.contract_path, "cached.json");
+
+        // Editing the source misses, re-parses and replaces the old entry
+        std::fs::write(&path, "contract_path: edited.json\n").unwrap();
+        let config = PyConfig::from_file_cached_in(path_str, &cache_dir).unwrap();
+        assert_eq!(config.contract_path, "edited.json");
+        let entries = cache_entries();
+        assert_eq!(entries.len(), 1);
+        assert!(entries[0].to_str().unwrap().ends_with(".json"));
+
+        std::fs::remove_dir_all(&dir).unwrap();
+    }
+
     #[test]
     fn test_config_repr() {
         pyo3::prepare_freethreaded_python();
@@ -1,8 +1,29 @@
 //! Python request context types for Archimedes
 
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyDict, PyList, PyString};
 use std::collections::HashMap;
+use std::sync::Mutex;
+
+/// Interned Python key objects for path parameter names, created once per name
+///
+/// Names come from the contract's path templates, so the set stays small.
+/// Interning makes the keys the same objects as the string literals handlers
+/// look them up with, so dict lookups hit CPython's identity fast path.
+static PATH_PARAM_KEYS: GILOnceCell<Mutex<HashMap<String, Py<PyString>>>> = GILOnceCell::new();
+
+/// Get the cached Python key for a path parameter name
+fn path_param_key<'py>(py: Python<'py>, name: &str) -> Bound<'py, PyString> {
+    let keys = PATH_PARAM_KEYS.get_or_init(py, || Mutex::new(HashMap::new()));
+    let mut keys = keys.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(key) = keys.get(name) {
+        return key.bind(py).clone();
+    }
+    let key = PyString::intern(py, name);
+    keys.insert(name.to_string(), key.clone().unbind());
+    key
+}
 
 /// Request context available to Python handlers
 ///
@@ -58,11 +79,13 @@ pub struct PyRequestContext {
 #[pymethods]
 impl PyRequestContext {
     /// Get path parameters as a dictionary
+    ///
+    /// Keys are interned once per parameter name and reused for every request.
     #[getter]
     fn path_params(&self, py: Python<'_>) -> PyResult<PyObject> {
         let dict = PyDict::new(py);
         for (k, v) in &self.path_params {
-            dict.set_item(k, v)?;
+            dict.set_item(path_param_key(py, k), v)?;
         }
         Ok(dict.into())
     }
@@ -462,6 +485,30 @@ mod tests {
         assert_eq!(ctx.path, "/orgs/org-456/users/123");
     }
 
+    #[test]
+    fn test_path_params_keys_are_interned() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let mut path_params = HashMap::new();
+            path_params.insert("userId".to_string(), "123".to_string());
+            let mut ctx = PyRequestContext::test("getUser");
+            ctx.path_params = path_params;
+
+            let interned = py
+                .import("sys")
+                .unwrap()
+                .call_method1("intern", ("userId",))
+                .unwrap();
+            for _ in 0..2 {
+                let dict = ctx.path_params(py).unwrap();
+                let dict = dict.bind(py).downcast::<PyDict>().unwrap();
+                let key = dict.keys().get_item(0).unwrap();
+                assert!(key.is(&interned));
+            }
+        });
+    }
+
     #[test]
     fn test_request_context_with_query_params() {
         let mut query_params = HashMap::new();
@@ -3,10 +3,50 @@
 use crate::error::{handler_error, internal_error};
 use crate::response::PyResponse;
 use crate::PyRequestContext;
+use bytes::Bytes;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList};
+use std::cell::RefCell;
 use std::collections::HashMap;
-use std::sync::RwLock;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Mutex, RwLock};
+
+thread_local! {
+    /// This thread's asyncio event loop and the generation it was created in
+    static EVENT_LOOP: RefCell<Option<(u64, PyObject)>> = const { RefCell::new(None) };
+}
+
+/// Every event loop handed out by `thread_event_loop`, closed by `close_event_loops`
+static EVENT_LOOPS: Mutex<Vec<PyObject>> = Mutex::new(Vec::new());
+
+/// Bumped by `close_event_loops` so threads replace their closed loop
+static LOOP_GENERATION: AtomicU64 = AtomicU64::new(0);
+
+/// Result of invoking a Python handler
+#[derive(Debug)]
+pub enum HandlerOutput {
+    /// JSON result; `Response` objects map to `{"status_code", "body"}`
+    Json(serde_json::Value),
+    /// Pre-encoded body from `Response.ok_raw()`, sent without re-serializing
+    Raw {
+        /// HTTP status code
+        status: u16,
+        /// Headers passed to `ok_raw()`
+        headers: HashMap<String, String>,
+        /// Response body
+        body: Bytes,
+    },
+}
+
+impl HandlerOutput {
+    /// Get the JSON result, or `None` for a pre-encoded body
+    pub fn into_json(self) -> Option<serde_json::Value> {
+        match self {
+            Self::Json(json) => Some(json),
+            Self::Raw { .. } => None,
+        }
+    }
+}
 
 /// Registry for Python handlers
 pub struct HandlerRegistry {
@@ -43,6 +83,31 @@ impl HandlerRegistry {
         Ok(())
     }
 
+    /// Register several handlers at once
+    ///
+    /// All handlers are validated before any is inserted, and the registry
+    /// lock is taken once for the whole batch.
+    pub fn register_many(&self, entries: Vec<(String, PyObject)>) -> PyResult<()> {
+        Python::with_gil(|py| {
+            for (operation_id, handler) in &entries {
+                if !handler.bind(py).is_callable() {
+                    return Err(handler_error(format!(
+                        "Handler for operation '{}' must be callable",
+                        operation_id
+                    )));
+                }
+            }
+            Ok(())
+        })?;
+
+        let mut handlers = self
+            .handlers
+            .write()
+            .map_err(|e| internal_error(format!("Failed to acquire handler lock: {e}")))?;
+        handlers.extend(entries);
+        Ok(())
+    }
+
     /// Get a handler for an operation
     pub fn get(&self, operation_id: &str) -> Option<PyObject> {
         self.handlers.read().ok().and_then(|h| {
@@ -100,13 +165,16 @@ impl HandlerRegistry {
     /// Invoke a handler
     ///
     /// This calls the Python handler with the request context and optional body.
+    /// If the handler returns an awaitable (an `async def` function, an object
+    /// with `async def __call__`, or a sync wrapper around either), it is
+    /// driven to completion on the calling thread's event loop.
     pub fn invoke(
         &self,
         py: Python<'_>,
         operation_id: &str,
         ctx: PyRequestContext,
         body: Option<serde_json::Value>,
-    ) -> PyResult<serde_json::Value> {
+    ) -> PyResult<HandlerOutput> {
         let handler = self.get(operation_id).ok_or_else(|| {
             handler_error(format!(
                 "No handler registered for operation '{operation_id}'"
@@ -120,28 +188,26 @@ impl HandlerRegistry {
             // Handler with body: handler(ctx, body)
             let body_py = json_to_python(py, &body)?;
             let args = (ctx, body_py);
-            let result = handler_ref.call1(args)?;
-            python_to_json(py, result.into())
+            let result = resolve_awaitable(py, handler_ref.call1(args)?)?;
+            handler_output(py, result)
         } else {
             // Handler without body: handler(ctx)
-            let result = handler_ref.call1((ctx,))?;
-            python_to_json(py, result.into())
+            let result = resolve_awaitable(py, handler_ref.call1((ctx,))?)?;
+            handler_output(py, result)
         }
     }
 
     /// Invoke an async handler
     ///
     /// This calls the Python async handler and awaits the result.
-    /// Note: Currently uses synchronous invocation. Full async support
-    /// will be added in a future version.
+    /// Equivalent to `invoke`, which already drives awaitable results.
     pub fn invoke_sync(
         &self,
         py: Python<'_>,
         operation_id: &str,
         ctx: PyRequestContext,
         body: Option<serde_json::Value>,
-    ) -> PyResult<serde_json::Value> {
-        // For now, use synchronous invocation
+    ) -> PyResult<HandlerOutput> {
         self.invoke(py, operation_id, ctx, body)
     }
 }
@@ -152,6 +218,88 @@ impl Default for HandlerRegistry {
     }
 }
 
+/// Convert a handler's return value into a [`HandlerOutput`]
+fn handler_output(py: Python<'_>, result: Bound<'_, PyAny>) -> PyResult<HandlerOutput> {
+    if let Ok(response) = result.downcast::<PyResponse>() {
+        let response = response.borrow();
+        if let Some(body) = response.raw_body() {
+            return Ok(HandlerOutput::Raw {
+                status: response.status,
+                headers: response.headers_ref().clone(),
+                body: body.clone(),
+            });
+        }
+    }
+    python_to_json(py, result.unbind()).map(HandlerOutput::Json)
+}
+
+/// Await a handler result if it is awaitable, otherwise return it unchanged
+///
+/// `Response` objects, dicts and lists, which sync handlers return, skip the
+/// `__await__` probe. Awaitables run on the calling thread's event loop.
+fn resolve_awaitable<'py>(
+    py: Python<'py>,
+    result: Bound<'py, PyAny>,
+) -> PyResult<Bound<'py, PyAny>> {
+    if result.is_instance_of::<PyResponse>()
+        || result.is_instance_of::<PyDict>()
+        || result.is_instance_of::<PyList>()
+        || !result.hasattr(pyo3::intern!(py, "__await__"))?
+    {
+        return Ok(result);
+    }
+
+    thread_event_loop(py)?
+        .bind(py)
+        .call_method1(pyo3::intern!(py, "run_until_complete"), (result,))
+}
+
+/// Get this thread's event loop, creating it on first use
+///
+/// The loop is reused across requests, avoiding the setup and teardown that
+/// `asyncio.run()` pays on every call. A loop left over from before the last
+/// `close_event_loops` is replaced.
+fn thread_event_loop(py: Python<'_>) -> PyResult<PyObject> {
+    EVENT_LOOP.with(|cell| {
+        let mut slot = cell.borrow_mut();
+        if let Some((created_in, event_loop)) = slot.as_ref() {
+            if *created_in == LOOP_GENERATION.load(Ordering::Acquire) {
+                return Ok(event_loop.clone_ref(py));
+            }
+        }
+
+        let event_loop = py
+            .import("asyncio")?
+            .call_method0("new_event_loop")?
+            .unbind();
+
+        // Register and tag under one lock so a concurrent close cannot miss it
+        let mut event_loops = EVENT_LOOPS.lock().unwrap_or_else(|e| e.into_inner());
+        event_loops.push(event_loop.clone_ref(py));
+        *slot = Some((
+            LOOP_GENERATION.load(Ordering::Acquire),
+            event_loop.clone_ref(py),
+        ));
+        Ok(event_loop)
+    })
+}
+
+/// Close every event loop created for async handlers
+///
+/// Called when the server stops. Threads that run handlers afterwards
+/// create a fresh loop.
+pub(crate) fn close_event_loops(py: Python<'_>) {
+    let event_loops = {
+        let mut event_loops = EVENT_LOOPS.lock().unwrap_or_else(|e| e.into_inner());
+        LOOP_GENERATION.fetch_add(1, Ordering::AcqRel);
+        std::mem::take(&mut *event_loops)
+    };
+    for event_loop in event_loops {
+        // Best-effort: a loop still running a handler cannot be closed
+        let _ = event_loop.bind(py).call_method0("close");
+    }
+}
+
 /// Convert serde_json::Value to Python object
 fn json_to_python(py: Python<'_>, value: &serde_json::Value) -> PyResult<PyObject> {
     Ok(match value {
@@ -368,6 +516,60 @@ mod tests {
         });
     }
 
+    #[test]
+    fn test_registry_register_many() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let handler1: PyObject = py
+                .eval(pyo3::ffi::c_str!("lambda ctx: {}"), None, None)
+                .unwrap()
+                .into();
+            let handler2: PyObject = py
+                .eval(pyo3::ffi::c_str!("lambda ctx: {}"), None, None)
+                .unwrap()
+                .into();
+
+            registry
+                .register_many(vec![
+                    ("op1".to_string(), handler1),
+                    ("op2".to_string(), handler2),
+                ])
+                .unwrap();
+
+            assert_eq!(registry.len(), 2);
+            assert!(registry.has("op1"));
+            assert!(registry.has("op2"));
+        });
+    }
+
+    #[test]
+    fn test_registry_register_many_rejects_batch_with_non_callable() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let handler: PyObject = py
+                .eval(pyo3::ffi::c_str!("lambda ctx: {}"), None, None)
+                .unwrap()
+                .into();
+            let non_callable: PyObject = py
+                .eval(pyo3::ffi::c_str!("'not a function'"), None, None)
+                .unwrap()
+                .into();
+
+            let result = registry.register_many(vec![
+                ("op1".to_string(), handler),
+                ("op2".to_string(), non_callable),
+            ]);
+            assert!(result.is_err());
+            assert!(registry.is_empty());
+        });
+    }
+
     #[test]
     fn test_registry_reject_non_callable() {
         pyo3::prepare_freethreaded_python();
@@ -386,6 +588,182 @@ mod tests {
         });
     }
 
+    #[test]
+    fn test_invoke_async_handler() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let locals = PyDict::new(py);
+            py.run(
+                pyo3::ffi::c_str!("async def handler(ctx):\n    return {'async': True}"),
+                None,
+                Some(&locals),
+            )
+            .unwrap();
+            let handler: PyObject = locals.get_item("handler").unwrap().unwrap().into();
+            registry.register("asyncOp".to_string(), handler).unwrap();
+
+            let result = registry
+                .invoke(py, "asyncOp", PyRequestContext::test("asyncOp"), None)
+                .unwrap()
+                .into_json()
+                .unwrap();
+            assert_eq!(result, serde_json::json!({"async": true}));
+        });
+    }
+
+    #[test]
+    fn test_invoke_async_handler_needing_running_loop() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let globals = PyDict::new(py);
+            py.run(
+                pyo3::ffi::c_str!(
+                    "import asyncio\n\nasync def handler(ctx):\n    await asyncio.sleep(0.001)\n    loop = asyncio.get_running_loop()\n    future = loop.create_future()\n    loop.call_soon(future.set_result, 'done')\n    return {'result': await future}"
+                ),
+                Some(&globals),
+                None,
+            )
+            .unwrap();
+            let handler: PyObject = globals.get_item("handler").unwrap().unwrap().into();
+            registry.register("sleepOp".to_string(), handler).unwrap();
+
+            let result = registry
+                .invoke(py, "sleepOp", PyRequestContext::test("sleepOp"), None)
+                .unwrap()
+                .into_json()
+                .unwrap();
+            assert_eq!(result, serde_json::json!({"result": "done"}));
+        });
+    }
+
+    #[test]
+    fn test_invoke_async_callable_instance() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let globals = PyDict::new(py);
+            py.run(
+                pyo3::ffi::c_str!(
+                    "class Handler:\n    async def __call__(self, ctx):\n        return {'instance': True}\n\nhandler = Handler()"
+                ),
+                Some(&globals),
+                None,
+            )
+            .unwrap();
+            let handler: PyObject = globals.get_item("handler").unwrap().unwrap().into();
+            registry
+                .register("callableOp".to_string(), handler)
+                .unwrap();
+
+            let result = registry
+                .invoke(py, "callableOp", PyRequestContext::test("callableOp"), None)
+                .unwrap()
+                .into_json()
+                .unwrap();
+            assert_eq!(result, serde_json::json!({"instance": true}));
+        });
+    }
+
+    #[test]
+    fn test_invoke_sync_wrapper_around_async_handler() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let globals = PyDict::new(py);
+            py.run(
+                pyo3::ffi::c_str!(
+                    "import functools\n\nasync def inner(ctx):\n    return {'wrapped': True}\n\n@functools.wraps(inner)\ndef handler(ctx):\n    return inner(ctx)"
+                ),
+                Some(&globals),
+                None,
+            )
+            .unwrap();
+            let handler: PyObject = globals.get_item("handler").unwrap().unwrap().into();
+            registry.register("wrappedOp".to_string(), handler).unwrap();
+
+            let result = registry
+                .invoke(py, "wrappedOp", PyRequestContext::test("wrappedOp"), None)
+                .unwrap()
+                .into_json()
+                .unwrap();
+            assert_eq!(result, serde_json::json!({"wrapped": true}));
+        });
+    }
+
+    #[test]
+    fn test_close_event_loops_replaces_thread_loop() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let first = thread_event_loop(py).unwrap();
+            assert!(first.is(&thread_event_loop(py).unwrap()));
+
+            close_event_loops(py);
+            let closed: bool = first
+                .bind(py)
+                .call_method0("is_closed")
+                .unwrap()
+                .extract()
+                .unwrap();
+            assert!(closed);
+
+            let second = thread_event_loop(py).unwrap();
+            assert!(!second.is(&first));
+        });
+    }
+
+    #[test]
+    fn test_invoke_raw_response() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let registry = HandlerRegistry::new();
+
+            let body = pyo3::types::PyBytes::new(py, br#"{"total":0}"#);
+            let response = py
+                .get_type::<PyResponse>()
+                .call_method1("ok_raw", (body, HashMap::from([("X-Total", "0")])))
+                .unwrap();
+            let globals = PyDict::new(py);
+            globals.set_item("response", response).unwrap();
+            let handler: PyObject = py
+                .eval(
+                    pyo3::ffi::c_str!("lambda ctx: response"),
+                    Some(&globals),
+                    None,
+                )
+                .unwrap()
+                .into();
+            registry.register("rawOp".to_string(), handler).unwrap();
+
+            let output = registry
+                .invoke(py, "rawOp", PyRequestContext::test("rawOp"), None)
+                .unwrap();
+            match output {
+                HandlerOutput::Raw {
+                    status,
+                    headers,
+                    body,
+                } => {
+                    assert_eq!(status, 200);
+                    assert_eq!(headers.get("X-Total").map(String::as_str), Some("0"));
+                    assert_eq!(body.as_ref(), br#"{"total":0}"#);
+                }
+                HandlerOutput::Json(json) => panic!("expected raw body, got {json}"),
+            }
+        });
+    }
+
     #[test]
     fn test_json_null_handling() {
         pyo3::prepare_freethreaded_python();
@@ -465,7 +843,7 @@ mod tests {
             let result = registry.invoke(py, "testOp", ctx, None);
             assert!(result.is_ok());
 
-            let response = result.unwrap();
+            let response = result.unwrap().into_json().unwrap();
             assert_eq!(response["status"], "ok");
             assert_eq!(response["data"], "testOp");
         });
@@ -500,7 +878,7 @@ mod tests {
             let result = registry.invoke(py, "createUser", ctx, Some(body));
             assert!(result.is_ok());
 
-            let response = result.unwrap();
+            let response = result.unwrap().into_json().unwrap();
             assert_eq!(response["received"], "Alice");
         });
     }
@@ -540,7 +918,7 @@ mod tests {
             let result = registry.invoke(py, "listItems", ctx, None);
             assert!(result.is_ok());
 
-            let response = result.unwrap();
+            let response = result.unwrap().into_json().unwrap();
             let arr = response.as_array().unwrap();
             assert_eq!(arr.len(), 2);
             assert_eq!(arr[0]["id"], 1);
@@ -597,7 +975,7 @@ mod tests {
             let result = registry.invoke(py, "protectedOp", ctx, None);
             assert!(result.is_ok());
 
-            let response = result.unwrap();
+            let response = result.unwrap().into_json().unwrap();
             assert_eq!(response["authenticated"], true);
             assert_eq!(response["subject"], "user-123");
         });
@@ -641,7 +1019,7 @@ mod tests {
             let result = registry.invoke(py, "getUser", ctx, None);
             assert!(result.is_ok());
 
-            let response = result.unwrap();
+            let response = result.unwrap().into_json().unwrap();
             assert_eq!(response["userId"], "user-456");
         });
     }
@@ -682,7 +1060,7 @@ mod tests {
             let result = registry.invoke(py, "traceOp", ctx, None);
             assert!(result.is_ok());
 
-            let response = result.unwrap();
+            let response = result.unwrap().into_json().unwrap();
             assert_eq!(response["traceId"], "abc123");
             assert_eq!(response["spanId"], "def456");
         });
@@ -55,7 +55,7 @@ pub use error::PyArchimedesError;
 pub use extractors::{
     PyCookies, PyForm, PyMultipart, PyMultipartField, PySameSite, PySetCookie, PyUploadedFile,
 };
-pub use handlers::HandlerRegistry;
+pub use handlers::{HandlerOutput, HandlerRegistry};
 pub use lifecycle::{PyLifecycle, ShutdownDecorator, StartupDecorator};
 pub use middleware::{
     add_response_headers, process_request, request_duration_ms, MiddlewareResult,
@@ -138,6 +138,24 @@ impl PyApp {
         Ok(())
     }
 
+    /// Register several handlers in one call
+    ///
+    /// Equivalent to calling `register_handler` for each entry, but the
+    /// handler registry is locked once for the whole batch.
+    ///
+    /// # Example (Python)
+    ///
+    /// ```python,ignore
+    /// app.register_many([
+    ///     ("getUser", get_user),
+    ///     ("createUser", create_user),
+    /// ])
+    /// ```
+    fn register_many(&self, handlers: Vec<(String, PyObject)>) -> PyResult<()> {
+        self.handlers.register_many(handlers)?;
+        Ok(())
+    }
+
     /// Register a startup hook
     ///
     /// Startup hooks run before the server starts accepting connections.
@@ -270,6 +288,9 @@ impl PyApp {
 
         self.running = false;
 
+        // Worker threads are gone with the runtime; close their event loops
+        handlers::close_event_loops(py);
+
         result.map_err(|e| PyArchimedesError::new_err(e))
     }
 
@@ -1,7 +1,8 @@
 //! Python response types for Archimedes
 
+use bytes::Bytes;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBytes, PyDict};
 use std::collections::HashMap;
 
 /// HTTP response returned from handlers
@@ -29,6 +30,9 @@ pub struct PyResponse {
     /// Response body (will be JSON serialized)
     body: Option<serde_json::Value>,
 
+    /// Pre-encoded JSON body, sent as-is instead of `body`
+    raw_body: Option<Bytes>,
+
     /// Response headers
     headers: HashMap<String, String>,
 }
@@ -58,13 +62,19 @@ impl PyResponse {
         Ok(Self {
             status,
             body: body_json,
+            raw_body: None,
             headers: headers.unwrap_or_default(),
         })
     }
 
     /// Get response body as Python object
+    ///
+    /// Pre-encoded bodies (see `ok_raw`) are returned as `bytes`.
     #[getter]
     fn body(&self, py: Python<'_>) -> PyResult<PyObject> {
+        if let Some(raw) = &self.raw_body {
+            return Ok(PyBytes::new(py, raw).into_any().unbind());
+        }
         match &self.body {
             Some(json) => json_to_python(py, json),
             None => Ok(py.None()),
@@ -74,6 +84,7 @@ impl PyResponse {
     /// Set response body from Python object
     fn set_body(&mut self, py: Python<'_>, value: PyObject) -> PyResult<()> {
         self.body = Some(python_to_json(py, value)?);
+        self.raw_body = None;
         Ok(())
     }
 
@@ -108,6 +119,27 @@ impl PyResponse {
         Self::new(py, 200, body, headers)
     }
 
+    /// Create an OK response (200) from a pre-encoded JSON body
+    ///
+    /// The bytes are sent as-is, skipping the Python-to-JSON conversion; the
+    /// caller is responsible for them being valid JSON. The `bytes` object is
+    /// referenced rather than copied, so handlers can cache their payload.
+    /// `headers` are sent with the body, and a `Content-Type` among them
+    /// replaces the default `application/json`.
+    #[staticmethod]
+    #[pyo3(signature = (body, headers = None))]
+    fn ok_raw(
+        body: &Bound<'_, PyBytes>,
+        headers: Option<HashMap<String, String>>,
+    ) -> PyResult<Self> {
+        Ok(Self {
+            status: 200,
+            body: None,
+            raw_body: Some(bytes_from_py(body)),
+            headers: headers.unwrap_or_default(),
+        })
+    }
+
     /// Create a Created response (201)
     #[staticmethod]
     #[pyo3(signature = (body = None, headers = None))]
@@ -125,6 +157,7 @@ impl PyResponse {
         Ok(Self {
             status: 204,
             body: None,
+            raw_body: None,
             headers: HashMap::new(),
         })
     }
@@ -137,6 +170,7 @@ impl PyResponse {
         Ok(Self {
             status: 400,
             body,
+            raw_body: None,
             headers: HashMap::new(),
         })
     }
@@ -149,6 +183,7 @@ impl PyResponse {
         Ok(Self {
             status: 401,
             body,
+            raw_body: None,
             headers: HashMap::new(),
         })
     }
@@ -161,6 +196,7 @@ impl PyResponse {
         Ok(Self {
             status: 403,
             body,
+            raw_body: None,
             headers: HashMap::new(),
         })
     }
@@ -173,6 +209,7 @@ impl PyResponse {
         Ok(Self {
             status: 404,
             body,
+            raw_body: None,
             headers: HashMap::new(),
         })
     }
@@ -185,6 +222,7 @@ impl PyResponse {
         Ok(Self {
             status: 500,
             body,
+            raw_body: None,
             headers: HashMap::new(),
         })
     }
@@ -207,6 +245,7 @@ impl PyResponse {
         Ok(Self {
             status: 302,
             body: None,
+            raw_body: None,
             headers,
         })
     }
@@ -219,6 +258,7 @@ impl PyResponse {
         Ok(Self {
             status: 301,
             body: None,
+            raw_body: None,
             headers,
         })
     }
@@ -231,6 +271,7 @@ impl PyResponse {
         Ok(Self {
             status: 303,
             body: None,
+            raw_body: None,
             headers,
         })
     }
@@ -243,6 +284,7 @@ impl PyResponse {
         Ok(Self {
             status: 307,
             body: None,
+            raw_body: None,
             headers,
         })
     }
@@ -276,6 +318,11 @@ impl PyResponse {
         self.body.as_ref()
     }
 
+    /// Get the pre-encoded body, if set via `ok_raw`
+    pub fn raw_body(&self) -> Option<&Bytes> {
+        self.raw_body.as_ref()
+    }
+
     /// Get headers as reference
     pub fn headers_ref(&self) -> &HashMap<String, String> {
         &self.headers
@@ -445,6 +492,35 @@ impl PyFileResponse {
     }
 }
 
+/// Python `bytes` object kept alive as the backing store of a [`Bytes`]
+struct PyBytesOwner {
+    _object: Py<PyBytes>,
+    ptr: *const u8,
+    len: usize,
+}
+
+// SAFETY: `ptr` points into the buffer of `_object`, which this owner keeps
+// alive. `bytes` objects are immutable and never move their buffer, so reading
+// it from any thread is sound without holding the GIL.
+unsafe impl Send for PyBytesOwner {}
+
+impl AsRef<[u8]> for PyBytesOwner {
+    fn as_ref(&self) -> &[u8] {
+        // SAFETY: see the `Send` impl above
+        unsafe { std::slice::from_raw_parts(self.ptr, self.len) }
+    }
+}
+
+/// Wrap a Python `bytes` object in a [`Bytes`] without copying its buffer
+fn bytes_from_py(body: &Bound<'_, PyBytes>) -> Bytes {
+    let data = body.as_bytes();
+    Bytes::from_owner(PyBytesOwner {
+        ptr: data.as_ptr(),
+        len: data.len(),
+        _object: body.clone().unbind(),
+    })
+}
+
 /// Guess MIME type from filename
 fn guess_mime_type(filename: &str) -> Option<String> {
     let ext = filename.rsplit('.').next()?.to_lowercase();
@@ -631,6 +707,26 @@ mod tests {
         });
     }
 
+    #[test]
+    fn test_ok_raw_response() {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let body = PyBytes::new(py, br#"{"total":0}"#);
+            let response = PyResponse::ok_raw(&body, None).unwrap();
+
+            assert_eq!(response.status, 200);
+            assert!(response.body_json().is_none());
+            assert_eq!(response.raw_body().unwrap().as_ref(), br#"{"total":0}"#);
+
+            // The body borrows the Python buffer instead of copying it
+            assert_eq!(
+                response.raw_body().unwrap().as_ptr(),
+                body.as_bytes().as_ptr()
+            );
+        });
+    }
+
     #[test]
     fn test_response_headers() {
         pyo3::prepare_freethreaded_python();
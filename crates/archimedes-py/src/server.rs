@@ -3,11 +3,13 @@
 //! This module provides a simple HTTP server that routes requests
 //! to Python handlers registered via the `@app.handler` decorator.
 
+use std::collections::HashMap;
 use std::convert::Infallible;
 use std::net::SocketAddr;
 use std::sync::Arc;
 
 use bytes::Bytes;
+use http::header::{HeaderName, HeaderValue, CONTENT_LENGTH, CONTENT_TYPE};
 use http::{Method, Request, Response, StatusCode};
 use http_body_util::{BodyExt, Full};
 use hyper::body::Incoming;
@@ -19,7 +21,7 @@ use serde::{Deserialize, Serialize};
 use tokio::net::TcpListener;
 use tokio::sync::watch;
 
-use crate::handlers::HandlerRegistry;
+use crate::handlers::{HandlerOutput, HandlerRegistry};
 use crate::middleware;
 
 /// HTTP response body type
@@ -233,19 +235,26 @@ fn invoke_python_handler(
     );
 
     // Acquire the GIL and invoke the handler
-    let (response_json, handler_error) = Python::with_gil(|py| {
+    let (output, handler_error) = Python::with_gil(|py| {
         match state
             .handlers
             .invoke(py, operation_id, mw_result.context, body)
         {
-            Ok(json) => (Some(json), None),
+            Ok(output) => (Some(output), None),
             Err(e) => (None, Some(format!("{}", e))),
         }
     });
 
     // Build response
-    let mut response = if let Some(json) = response_json {
-        json_to_response(&json)
+    let mut response = if let Some(output) = output {
+        match output {
+            HandlerOutput::Json(json) => json_to_response(&json),
+            HandlerOutput::Raw {
+                status,
+                headers,
+                body,
+            } => raw_response(status, headers, body),
+        }
     } else {
         let error_msg = handler_error.unwrap_or_else(|| "Unknown error".to_string());
         eprintln!("[archimedes] Handler error: {}", error_msg);
@@ -303,6 +312,41 @@ fn json_to_response(json: &serde_json::Value) -> HttpResponse {
         .unwrap()
 }
 
+/// Response for a pre-encoded body from Response.ok_raw()
+///
+/// The body is sent as-is with its length known upfront. Handler headers
+/// are applied on top of the default `Content-Type`.
+fn raw_response(status: u16, headers: HashMap<String, String>, body: Bytes) -> HttpResponse {
+    let content_length = HeaderValue::from(body.len());
+    let mut response = Response::builder()
+        .status(status)
+        .header(CONTENT_TYPE, "application/json")
+        .body(Full::new(body))
+        .unwrap();
+
+    for (name, value) in headers {
+        match (
+            HeaderName::from_bytes(name.as_bytes()),
+            HeaderValue::from_str(&value),
+        ) {
+            (Ok(name), Ok(value)) => {
+                response.headers_mut().insert(name, value);
+            }
+            _ => {
+                return error_response(
+                    StatusCode::INTERNAL_SERVER_ERROR,
+                    &format!("Invalid response header '{name}'"),
+                );
+            }
+        }
+    }
+
+    response
+        .headers_mut()
+        .insert(CONTENT_LENGTH, content_length);
+    response
+}
+
 /// Health check response
 fn health_response() -> HttpResponse {
     let body = serde_json::json!({
@@ -682,10 +726,45 @@ mod tests {
         assert_eq!(response.status(), StatusCode::NO_CONTENT);
     }
 
+    #[test]
+    fn test_raw_response() {
+        let headers = HashMap::from([
+            ("Cache-Control".to_string(), "max-age=5".to_string()),
+            (
+                "Content-Type".to_string(),
+                "application/vnd.users+json".to_string(),
+            ),
+        ]);
+        let response = raw_response(
+            200,
+            headers,
+            Bytes::from_static(br#"{"users":[],"total":0}"#),
+        );
+        assert_eq!(response.status(), StatusCode::OK);
+        assert_eq!(response.headers()["content-length"], "22");
+        assert_eq!(response.headers()["cache-control"], "max-age=5");
+        assert_eq!(
+            response.headers()["content-type"],
+            "application/vnd.users+json"
+        );
+
+        let body = tokio_test::block_on(response.into_body().collect())
+            .unwrap()
+            .to_bytes();
+        assert_eq!(body.as_ref(), br#"{"users":[],"total":0}"#);
+    }
+
     // =========================================================================
     // Server Error Tests
     // =========================================================================
 
+    #[test]
+    fn test_raw_response_rejects_invalid_header() {
+        let headers = HashMap::from([("Bad Header".to_string(), "x".to_string())]);
+        let response = raw_response(200, headers, Bytes::from_static(b"{}"));
+        assert_eq!(response.status(), StatusCode::INTERNAL_SERVER_ERROR);
+    }
+
     #[test]
     fn test_server_error_display() {
         let bind_error = ServerError::BindError("Address already in use".to_string());
@@ -8,15 +8,17 @@ All middleware (validation, authorization, telemetry) is handled automatically
 by Archimedes - the developer only writes business logic.
 
 Features demonstrated:
-- Handler registration with decorators
+- Batched handler registration with app.register_many() (sync and async handlers)
 - Sub-routers with Router.prefix() and Router.tag()
 - Lifecycle hooks with @app.on_startup and @app.on_shutdown
 - Request context and path parameters
 - Response helpers (ok, created, not_found, etc.)
 """
 
-import uuid
+import json
+import time
 from datetime import datetime, timezone
+from os import urandom
 from typing import Optional
 
 # Import from archimedes native bindings
@@ -42,15 +44,19 @@ users_db: dict[str, dict] = {
     },
 }
 
+# Secondary index for O(1) duplicate-email checks (email -> user ID)
+emails_index: dict[str, str] = {u["email"]: uid for uid, u in users_db.items()}
+
 
 # =============================================================================
 # Application Setup
 # =============================================================================
 
 # Create configuration from file or environment
+# from_file_cached() reuses the parsed file until it changes on disk.
 # In development, you can also create config directly:
 #   config = Config(contract_path="../contract.json", listen_port=8002)
-config = Config.from_file("archimedes.yaml")
+config = Config.from_file_cached("archimedes.yaml")
 app = App(config)
 
 
@@ -107,26 +113,68 @@ async def flush_metrics():
 users_router = Router().prefix("/users").tag("users").tag("api")
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+# (epoch second, ISO-8601 timestamp) for the most recently formatted second
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as ISO-8601, formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _ts_cache[1]
+
+
+# Reused healthCheck body; only the timestamp changes between requests
+_HEALTH_TEMPLATE: dict[str, str] = {
+    "status": "healthy",
+    "service": "example-python-native",
+    "timestamp": "",
+}
+
+# (timestamp, encoded healthCheck body) for the most recent second
+_health_cache: tuple[str, bytes] = ("", b"")
+
+
+def _health_body() -> bytes:
+    """Return the encoded healthCheck body, re-encoded at most once per second."""
+    global _health_cache
+    timestamp = _iso_now()
+    if timestamp != _health_cache[0]:
+        _HEALTH_TEMPLATE["timestamp"] = timestamp
+        _health_cache = (timestamp, json.dumps(_HEALTH_TEMPLATE).encode())
+    return _health_cache[1]
+
+
+# Serialized listUsers body, rebuilt lazily after any mutation of users_db
+_users_cache: Optional[bytes] = None
+
+
+def _invalidate_users_cache() -> None:
+    """Drop the cached listUsers body after users_db changes."""
+    global _users_cache
+    _users_cache = None
+
+
 # =============================================================================
 # Handlers
 # =============================================================================
 
 
-@app.handler("healthCheck")
-def health_check(ctx: RequestContext) -> Response:
+async def health_check(ctx: RequestContext) -> Response:
     """Health check endpoint.
     
     No authentication required - this is handled by contract configuration.
     """
-    return Response.ok({
-        "status": "healthy",
-        "service": "example-python-native",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    })
+    return Response.ok_raw(_health_body())
 
 
-@app.handler("listUsers")
-def list_users(ctx: RequestContext) -> Response:
+async def list_users(ctx: RequestContext) -> Response:
     """List all users.
     
     Authorization is handled automatically by Archimedes middleware.
@@ -135,14 +183,17 @@ def list_users(ctx: RequestContext) -> Response:
     # ctx.identity provides caller information (already validated)
     # ctx.trace_id for distributed tracing correlation
     
-    return Response.ok({
-        "users": list(users_db.values()),
-        "total": len(users_db),
-    })
+    global _users_cache
+    if _users_cache is None:
+        _users_cache = json.dumps({
+            "users": list(users_db.values()),
+            "total": len(users_db),
+        }).encode()
+    
+    return Response.ok_raw(_users_cache)
 
 
-@app.handler("getUser")
-def get_user(ctx: RequestContext) -> Response:
+async def get_user(ctx: RequestContext) -> Response:
     """Get a user by ID.
     
     Path parameters are extracted automatically and validated
@@ -157,7 +208,6 @@ def get_user(ctx: RequestContext) -> Response:
     return Response.ok(user)
 
 
-@app.handler("createUser")
 def create_user(ctx: RequestContext, body: dict) -> Response:
     """Create a new user.
     
@@ -165,11 +215,10 @@ def create_user(ctx: RequestContext, body: dict) -> Response:
     No need for Pydantic or manual validation.
     """
     # Check for duplicate email
-    for user in users_db.values():
-        if user["email"] == body["email"]:
-            return Response.bad_request(f"User with email '{body['email']}' already exists")
+    if body["email"] in emails_index:
+        return Response.bad_request(f"User with email '{body['email']}' already exists")
     
-    user_id = str(uuid.uuid4())
+    user_id = urandom(16).hex()
     user = {
         "id": user_id,
         "name": body["name"],
@@ -177,11 +226,12 @@ def create_user(ctx: RequestContext, body: dict) -> Response:
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
     users_db[user_id] = user
+    emails_index[user["email"]] = user_id
+    _invalidate_users_cache()
     
     return Response.created(user)
 
 
-@app.handler("updateUser")
 def update_user(ctx: RequestContext, body: dict) -> Response:
     """Update a user.
     
@@ -193,31 +243,58 @@ def update_user(ctx: RequestContext, body: dict) -> Response:
     if not user:
         return Response.not_found(f"User with ID '{user_id}' not found")
     
+    # Reject an email that already belongs to another user
+    new_email = body.get("email")
+    if new_email is not None and emails_index.get(new_email, user_id) != user_id:
+        return Response.bad_request(f"User with email '{new_email}' already exists")
+    
     # Update only provided fields
     if "name" in body and body["name"] is not None:
         user["name"] = body["name"]
-    if "email" in body and body["email"] is not None:
-        user["email"] = body["email"]
+    if new_email is not None:
+        if emails_index.get(user["email"]) == user_id:
+            del emails_index[user["email"]]
+        user["email"] = new_email
+        emails_index[new_email] = user_id
     
-    users_db[user_id] = user
+    # user is the stored dict, so the updates above are already in users_db
+    _invalidate_users_cache()
     return Response.ok(user)
 
 
-@app.handler("deleteUser")
-def delete_user(ctx: RequestContext) -> Response:
+async def delete_user(ctx: RequestContext) -> Response:
     """Delete a user.
     
     Returns 204 No Content on success.
     """
     user_id = ctx.path_params["userId"]
     
-    if user_id not in users_db:
+    user = users_db.pop(user_id, None)
+    if user is None:
         return Response.not_found(f"User with ID '{user_id}' not found")
     
-    del users_db[user_id]
+    if emails_index.get(user["email"]) == user_id:
+        del emails_index[user["email"]]
+    _invalidate_users_cache()
     return Response.no_content()
 
 
+# =============================================================================
+# Handler Registration
+# =============================================================================
+
+# Operation ID -> handler table, registered with a single batched call
+HANDLERS = [
+    ("healthCheck", health_check),
+    ("listUsers", list_users),
+    ("getUser", get_user),
+    ("createUser", create_user),
+    ("updateUser", update_user),
+    ("deleteUser", delete_user),
+]
+app.register_many(HANDLERS)
+
+
 # =============================================================================
 # Main Entry Point
 # =============================================================================
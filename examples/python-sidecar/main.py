@@ -5,14 +5,16 @@ This service demonstrates how to build a Python service that works with
 the Archimedes sidecar for contract validation, authorization, and observability.
 """
 
-import json
 import logging
 import uuid
 from datetime import datetime
-from typing import Optional
+from os import urandom
+from typing import Annotated, Optional
 
-from fastapi import FastAPI, HTTPException, Header, Request
-from pydantic import BaseModel, EmailStr
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Header, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, StringConstraints
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +27,7 @@ app = FastAPI(
     title="Example Python Service",
     description="A Python service demonstrating Archimedes sidecar integration",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -32,6 +35,10 @@ app = FastAPI(
 # Models
 # =============================================================================
 
+# Anchored pattern covering common addresses; cheaper than email-validator
+EMAIL_RE = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
+EmailAddress = Annotated[str, StringConstraints(pattern=EMAIL_RE)]
+
 
 class CallerIdentity(BaseModel):
     """Caller identity extracted from X-Caller-Identity header."""
@@ -52,14 +59,14 @@ class CreateUserRequest(BaseModel):
     """Request body for creating a user."""
 
     name: str
-    email: EmailStr
+    email: EmailAddress
 
 
 class UpdateUserRequest(BaseModel):
     """Request body for updating a user."""
 
     name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[EmailAddress] = None
 
 
 class User(BaseModel):
@@ -114,6 +121,9 @@ users_db: dict[str, User] = {
     ),
 }
 
+# Secondary index for O(1) duplicate-email checks (email -> user ID)
+emails_index: dict[str, str] = {u.email: uid for uid, u in users_db.items()}
+
 
 # =============================================================================
 # Helper Functions
@@ -125,9 +135,9 @@ def parse_caller_identity(header_value: Optional[str]) -> Optional[CallerIdentit
     if not header_value:
         return None
     try:
-        data = json.loads(header_value)
+        data = orjson.loads(header_value)
         return CallerIdentity(**data)
-    except (json.JSONDecodeError, ValueError) as e:
+    except (orjson.JSONDecodeError, ValueError) as e:
         logger.warning(f"Failed to parse caller identity: {e}")
         return None
 
@@ -138,7 +148,10 @@ def get_request_context(
     x_caller_identity: Optional[str] = Header(None),
     x_operation_id: Optional[str] = Header(None),
 ) -> dict:
-    """Extract request context from sidecar-provided headers."""
+    """Extract request context from sidecar-provided headers.
+
+    Used as a FastAPI dependency: `ctx: dict = Depends(get_request_context)`.
+    """
     caller = parse_caller_identity(x_caller_identity)
     return {
         "request_id": x_request_id or str(uuid.uuid4()),
@@ -166,13 +179,9 @@ async def health_check():
 
 @app.get("/users", response_model=UsersResponse)
 async def list_users(
-    request: Request,
-    x_request_id: Optional[str] = Header(None),
-    x_caller_identity: Optional[str] = Header(None),
-    x_operation_id: Optional[str] = Header(None),
+    ctx: dict = Depends(get_request_context),
 ):
     """List all users."""
-    ctx = get_request_context(request, x_request_id, x_caller_identity, x_operation_id)
     logger.info(f"[{ctx['request_id']}] Listing users, caller: {ctx['caller']}")
 
     return UsersResponse(
@@ -184,13 +193,9 @@ async def list_users(
 @app.get("/users/{user_id}", response_model=User)
 async def get_user(
     user_id: str,
-    request: Request,
-    x_request_id: Optional[str] = Header(None),
-    x_caller_identity: Optional[str] = Header(None),
-    x_operation_id: Optional[str] = Header(None),
+    ctx: dict = Depends(get_request_context),
 ):
     """Get a user by ID."""
-    ctx = get_request_context(request, x_request_id, x_caller_identity, x_operation_id)
     logger.info(f"[{ctx['request_id']}] Getting user {user_id}, caller: {ctx['caller']}")
 
     user = users_db.get(user_id)
@@ -209,28 +214,23 @@ async def get_user(
 @app.post("/users", response_model=User, status_code=201)
 async def create_user(
     body: CreateUserRequest,
-    request: Request,
-    x_request_id: Optional[str] = Header(None),
-    x_caller_identity: Optional[str] = Header(None),
-    x_operation_id: Optional[str] = Header(None),
+    ctx: dict = Depends(get_request_context),
 ):
     """Create a new user."""
-    ctx = get_request_context(request, x_request_id, x_caller_identity, x_operation_id)
     logger.info(f"[{ctx['request_id']}] Creating user, caller: {ctx['caller']}")
 
     # Check for duplicate email
-    for user in users_db.values():
-        if user.email == body.email:
-            raise HTTPException(
-                status_code=400,
-                detail=ErrorResponse(
-                    code="EMAIL_EXISTS",
-                    message=f"User with email '{body.email}' already exists",
-                    request_id=ctx["request_id"],
-                ).model_dump(),
-            )
-
-    user_id = str(uuid.uuid4())
+    if body.email in emails_index:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                code="EMAIL_EXISTS",
+                message=f"User with email '{body.email}' already exists",
+                request_id=ctx["request_id"],
+            ).model_dump(),
+        )
+
+    user_id = urandom(16).hex()
     user = User(
         id=user_id,
         name=body.name,
@@ -238,6 +238,7 @@ async def create_user(
         created_at=datetime.utcnow().isoformat() + "Z",
     )
     users_db[user_id] = user
+    emails_index[user.email] = user_id
 
     logger.info(f"[{ctx['request_id']}] Created user {user_id}")
     return user
@@ -247,13 +248,9 @@ async def create_user(
 async def update_user(
     user_id: str,
     body: UpdateUserRequest,
-    request: Request,
-    x_request_id: Optional[str] = Header(None),
-    x_caller_identity: Optional[str] = Header(None),
-    x_operation_id: Optional[str] = Header(None),
+    ctx: dict = Depends(get_request_context),
 ):
     """Update a user."""
-    ctx = get_request_context(request, x_request_id, x_caller_identity, x_operation_id)
     logger.info(f"[{ctx['request_id']}] Updating user {user_id}, caller: {ctx['caller']}")
 
     user = users_db.get(user_id)
@@ -267,22 +264,28 @@ async def update_user(
             ).model_dump(),
         )
 
-    # Update fields
-    if body.name is not None:
-        user = User(
-            id=user.id,
-            name=body.name,
-            email=user.email,
-            created_at=user.created_at,
-        )
-    if body.email is not None:
-        user = User(
-            id=user.id,
-            name=user.name,
-            email=body.email,
-            created_at=user.created_at,
+    # Reject an email that already belongs to another user
+    if body.email is not None and emails_index.get(body.email, user_id) != user_id:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                code="EMAIL_EXISTS",
+                message=f"User with email '{body.email}' already exists",
+                request_id=ctx["request_id"],
+            ).model_dump(),
         )
-    users_db[user_id] = user
+
+    # Update only provided fields (model_copy skips re-validation)
+    updates = {
+        k: v for k, v in (("name", body.name), ("email", body.email)) if v is not None
+    }
+    if updates:
+        if "email" in updates:
+            if emails_index.get(user.email) == user_id:
+                del emails_index[user.email]
+            emails_index[updates["email"]] = user_id
+        user = user.model_copy(update=updates)
+        users_db[user_id] = user
 
     logger.info(f"[{ctx['request_id']}] Updated user {user_id}")
     return user
@@ -291,13 +294,9 @@ async def update_user(
 @app.delete("/users/{user_id}", status_code=204)
 async def delete_user(
     user_id: str,
-    request: Request,
-    x_request_id: Optional[str] = Header(None),
-    x_caller_identity: Optional[str] = Header(None),
-    x_operation_id: Optional[str] = Header(None),
+    ctx: dict = Depends(get_request_context),
 ):
     """Delete a user."""
-    ctx = get_request_context(request, x_request_id, x_caller_identity, x_operation_id)
     logger.info(f"[{ctx['request_id']}] Deleting user {user_id}, caller: {ctx['caller']}")
 
     if user_id not in users_db:
@@ -310,7 +309,9 @@ async def delete_user(
             ).model_dump(),
         )
 
-    del users_db[user_id]
+    user = users_db.pop(user_id)
+    if emails_index.get(user.email) == user_id:
+        del emails_index[user.email]
     logger.info(f"[{ctx['request_id']}] Deleted user {user_id}")
 
 